@@ -62,7 +62,6 @@ import os
 
 from tools import parser_interface
 from utils.exceptions_interface import EnviroInterfaceError
-from utils.logger_interface import Logger
 
 # ----
 
@@ -71,10 +70,6 @@ __all__ = ["enviro_to_obj"]
 
 # ----
 
-logger = Logger(caller_name=__name__)
-
-# ----
-
 
 def enviro_to_obj() -> object:
     """
@@ -101,28 +96,17 @@ def enviro_to_obj() -> object:
 
     """
 
-    # Collect the run-time argument environment and format
-    # accordingly.
-    envdict = parser_interface.dict_formatter(in_dict=dict(os.environ))
-
-    # Build the output object; proceed accordingly.
-    envobj = parser_interface.object_define()
-
-    for envvar in envdict:
-
-        try:
-            value = parser_interface.dict_key_value(
-                dict_in=envdict, key=envvar, no_split=True
-            )
-            envobj = parser_interface.object_setattr(
-                object_in=envobj, key=envvar, value=value
-            )
-
-        except Exception as errmsg:
-            msg = (
-                "Casting the runtime environment as a Python dictionary "
-                f"failed with error {errmsg}. Aborting!!!"
-            )
-            raise EnviroInterfaceError(msg=msg) from errmsg
+    # Collect the run-time argument environment, format accordingly,
+    # and build the output object; proceed accordingly.
+    try:
+        envdict = parser_interface.dict_formatter(in_dict=os.environ)
+        envobj = parser_interface.dict_toobject(in_dict=envdict)
+
+    except Exception as errmsg:
+        msg = (
+            "Casting the runtime environment as a Python dictionary "
+            f"failed with error {errmsg}. Aborting!!!"
+        )
+        raise EnviroInterfaceError(msg=msg) from errmsg
 
     return envobj
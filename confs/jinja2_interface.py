@@ -32,41 +32,58 @@ Description
 Functions
 ---------
 
-    _fail_missing_vars(tmpl_path, in_dict)
+    _find_missing_vars(env, tmpl_str, in_dict, fail_missing=False)
 
-        This function parses the Jinja2-formatted template file and
+        This function parses the Jinja2-formatted template string and
         the Python dictionary containing the Jinja2 template key and
-        value pairs; if a Jinja2-formatted template file variable has
-        not been defined (i.e., is missing) a Jinja2InterfaceError
+        value pairs; if a Jinja2-formatted template variable has not
+        been defined (i.e., is missing) a Jinja2InterfaceError
         exception is raised.
 
-    _get_env(tmpl_path)
+    _get_bytecode_cache()
 
-        This function defines the Jinja2 environment object.
+        This function defines the Jinja2 bytecode cache object shared
+        by all Jinja2 environment objects.
 
-    _get_template(tmpl_path)
+    _get_env(dirname)
 
-        This function defines the Jinja2 environment template object.
+        This function defines the Jinja2 environment object for the
+        specified template directory tree path; the environment
+        objects are cached such that they are shared by all templates
+        within the respective directory tree path.
+
+    _get_template(env, tmpl_str, tmpl_name=None, tmpl_file=None)
+
+        This function compiles the Jinja2-formatted template string;
+        the compiled templates are cached using the template string
+        contents.
 
     _get_template_file_attrs(tmpl_path)
 
         This function returns the template file name attributes.
 
-    _get_template_vars(tmpl_path)
+    _get_template_vars(env, tmpl_str)
 
         This function collects the template variable names from a
-        Jinja2-formatted template file.
+        Jinja2-formatted template string.
 
-    _replace_tmplmarkser(tmpl_path)
+    _replace_tmplmarkers(tmpl_str)
 
         This function replaces specified non-Jinja2-formatted template
         string-values with the respective Jinja2-formatted template
-        indicators; the updated template file is written to a
-        temporary (e.g., virtual) file path and returned to the
+        indicators and returns the updated template string to the
         calling function; the non-Jinja2-formatted template
         string-values are defined bu the `confs/template_interface.py`
         module attribute `TMPL_ITEM_LIST`.
 
+    compile_templates(tmpl_dir)
+
+        This function compiles all Jinja2-formatted templates beneath
+        a specified directory tree path ahead of rendering; the
+        compiled templates are written to the Jinja2 bytecode cache
+        such that subsequent processes need not compile the
+        respective templates.
+
     write_from_template(tmpl_path, output_file, in_dict,
                         fail_missing=False, rpl_tmpl_mrks=False,
                         f90_bool=False, skip_missing=False)
@@ -94,7 +111,7 @@ History
 # ----
 
 # pylint: disable=broad-except
-# pylint: disable=consider-using-f-string
+# pylint: disable=import-outside-toplevel
 # pylint: disable=raise-missing-from
 # pylint: disable=too-many-arguments
 # pylint: disable=too-many-locals
@@ -107,10 +124,11 @@ __email__ = "henry.winterbottom@noaa.gov"
 
 # ----
 
+import functools
 import os
-from typing import Dict, List, Tuple
+import re
+from typing import Dict, FrozenSet, List, Set, Tuple
 
-from jinja2 import Environment, FileSystemLoader, meta
 from tools import fileio_interface, parser_interface
 from utils.exceptions_interface import Jinja2InterfaceError
 from utils.logger_interface import Logger
@@ -120,35 +138,51 @@ from confs.template_interface import TMPL_ITEM_LIST
 # ----
 
 # Define all available functions.
-__all__ = ["write_from_template", "write_jinja2"]
+__all__ = ["compile_templates", "write_from_template", "write_jinja2"]
 
 # ----
 
 logger = Logger(caller_name=__name__)
 
+# Define the regular expression matching any of the
+# non-Jinja2-formatted template markers; each template marker is an
+# alternative within the regular expression and the template variable
+# name is collected from the respective group; the leading and
+# trailing template marker strings are not stripped such that native
+# Jinja2-formatted expressions (e.g., `{{- NAME -}}`) are not matched.
+TMPL_MARKER_REGEX = re.compile(
+    "|".join(
+        rf"{re.escape(start_str)}\s*(.*?)\s*{re.escape(stop_str)}"
+        for (start_str, stop_str) in (item.split("%s") for item in TMPL_ITEM_LIST)
+    )
+)
+
 # ----
 
 
 def _find_missing_vars(
-    tmpl_path: str, in_dict: Dict, fail_missing: bool = False
+    env: object, tmpl_str: str, in_dict: Dict, fail_missing: bool = False
 ) -> List:
     """
     Description
     -----------
 
-    This function parses the Jinja2-formatted template file and the
+    This function parses the Jinja2-formatted template string and the
     Python dictionary containing the Jinja2 template key and value
-    pairs; if a Jinja2-formatted template file variable has not been
+    pairs; if a Jinja2-formatted template variable has not been
     defined (i.e., is missing) a Jinja2InterfaceError exception is
     raised.
 
     Parameters
     ----------
 
-    tmpl_path: str
+    env: object
 
-        A Python string defining the path to the Jinja2-formatted
-        template file.
+        A Python object containing the Jinja2 environment.
+
+    tmpl_str: str
+
+        A Python string containing the Jinja2-formatted template.
 
     in_dict: Dict
 
@@ -195,17 +229,17 @@ def _find_missing_vars(
         )
         raise Jinja2InterfaceError(msg=msg)
 
-    # Collect the variables within the Jinja2-formatted template file.
-    variables = _get_template_vars(tmpl_path=tmpl_path)
+    # Collect the variables within the Jinja2-formatted template.
+    variables = _get_template_vars(env=env, tmpl_str=tmpl_str)
 
-    # Build the list of attribute variables.
-    compare_variables = _get_defvars(in_dict=in_dict)
+    # Build the set of attribute variables; this includes the
+    # run-time environment (`env`) which is provided to all rendered
+    # templates.
+    compare_variables = _get_defvars(in_dict=in_dict) | {"env"}
 
-    # Compare the respective variable lists and find unique (i.e.,
+    # Compare the respective variable sets and find unique (i.e.,
     # missing variables).
-    missing_vars_list = [
-        variable for variable in variables if variable not in compare_variables
-    ]
+    missing_vars_list = sorted(variables - compare_variables)
 
     if len(missing_vars_list) != 0:
         msg = (
@@ -224,12 +258,12 @@ def _find_missing_vars(
 # ----
 
 
-def _get_defvars(in_dict: Dict) -> List:
+def _get_defvars(in_dict: Dict) -> Set:
     """
     Description
     -----------
 
-    This function defines a list of the variables provided to populate
+    This function defines a set of the variables provided to populate
     the respective template; the variable names are collected from the
     key values of the input Python dictionary `in_dict`.
 
@@ -244,44 +278,87 @@ def _get_defvars(in_dict: Dict) -> List:
     Returns
     -------
 
-    defvars_list: List
+    defvars_set: Set
 
-        A Python list of the variables defined within the Python
+        A Python set of the variables defined within the Python
         dictionary, to populate the Jinja2-formatted template, key and
         value pairs.
 
     """
 
-    # Define a list of the specified variables to populate the
-    # respective template.
-    defvars_list = []
+    # Define a set of the specified variables to populate the
+    # respective template; for tuple-type keys, the first element
+    # defines the variable name.
+    defvars_set = {(item[0] if isinstance(item, tuple) else item) for item in in_dict}
 
-    for item in list(in_dict):
-        if isinstance(item, tuple):
-            defvars_list.append(item[0])
-        else:
-            defvars_list.append(item)
+    return defvars_set
+
+
+# ----
+
+
+@functools.lru_cache(maxsize=None)
+def _get_bytecode_cache() -> object:
+    """
+    Description
+    -----------
+
+    This function defines the Jinja2 bytecode cache object; the
+    bytecode cache is shared by all Jinja2 environment objects such
+    that the compiled templates may be reused across calls and
+    processes; the bytecode cache directory tree path may be specified
+    by the environment variable `JINJA2_BYTECODE_CACHE`, otherwise the
+    Jinja2 default (i.e., beneath the system temporary directory) is
+    used.
+
+    Returns
+    -------
+
+    bytecode_cache: object
+
+        A Python object containing the Jinja2 bytecode cache.
+
+    """
 
-    return defvars_list
+    # The Jinja2 package is imported only when a Jinja2 template is to
+    # be rendered; `write_jinja2` does not require it.
+    from jinja2 import FileSystemBytecodeCache
+
+    # Define the Jinja2 bytecode cache directory tree path; proceed
+    # accordingly.
+    directory = parser_interface.enviro_get(envvar="JINJA2_BYTECODE_CACHE")
+    if directory is not None:
+        fileio_interface.makedirs(path=directory)
+
+    # Establish the Jinja2 bytecode cache.
+    bytecode_cache = FileSystemBytecodeCache(
+        directory=directory, pattern="__jinja2_%s.cache"
+    )
+
+    return bytecode_cache
 
 
 # ----
 
 
-def _get_env(tmpl_path: str) -> object:
+@functools.lru_cache(maxsize=64)
+def _get_env(dirname: str) -> object:
     """
     Description
     -----------
 
-    This function defines the Jinja2 environment object.
+    This function defines the Jinja2 environment object for the
+    specified template directory tree path; the environment objects
+    are cached such that they are shared by all templates within the
+    respective directory tree path.
 
     Parameters
     ----------
 
-    tmpl_path: str
+    dirname: str
 
-        A Python string defining the path to the Jinja2-formatted
-        template file.
+        A Python string defining the directory tree path containing
+        the Jinja2-formatted template file(s).
 
     Returns
     -------
@@ -292,11 +369,15 @@ def _get_env(tmpl_path: str) -> object:
 
     """
 
-    # Collect the Jinja2-formatted template file attributes.
-    (dirname, _) = _get_template_file_attrs(tmpl_path=tmpl_path)
+    from jinja2 import Environment, FileSystemLoader
 
-    # Establish the Jinja2 environment.
-    env = Environment(loader=FileSystemLoader(searchpath=dirname))
+    # Establish the Jinja2 environment; the compiled templates are
+    # cached by `_get_template` rather than by the Jinja2 environment.
+    env = Environment(
+        loader=FileSystemLoader(searchpath=dirname),
+        bytecode_cache=_get_bytecode_cache(),
+        cache_size=0,
+    )
 
     return env
 
@@ -304,19 +385,45 @@ def _get_env(tmpl_path: str) -> object:
 # ----
 
 
-def _get_template(tmpl_path: str) -> object:
+@functools.lru_cache(maxsize=256)
+def _get_template(
+    env: object, tmpl_str: str, tmpl_name: str = None, tmpl_file: str = None
+) -> object:
     """
     Description
     -----------
 
-    This function defines the Jinja2 environment template object.
+    This function compiles the Jinja2-formatted template string; the
+    compiled templates are cached using the template string contents
+    such that a template is recompiled only if the respective template
+    string has been modified; if the template name is specified, the
+    compiled template is loaded from (or written to) the Jinja2
+    bytecode cache.
 
     Parameters
     ----------
 
-    tmpl_path: str
+    env: object
 
-        A Python string defining the path to the Jinja2-formatted
+        A Python object containing the Jinja2 environment.
+
+    tmpl_str: str
+
+        A Python string containing the Jinja2-formatted template.
+
+    Keywords
+    --------
+
+    tmpl_name: str, optional
+
+        A Python string specifying the Jinja2-formatted template name
+        relative to the Jinja2 environment loader; if not specified,
+        the compiled template is not written to the Jinja2 bytecode
+        cache.
+
+    tmpl_file: str, optional
+
+        A Python string specifying the path to the Jinja2-formatted
         template file.
 
     Returns
@@ -324,19 +431,27 @@ def _get_template(tmpl_path: str) -> object:
 
     tmpl: object
 
-        A Python object containing the Jinja2 environment template
-        object.
+        A Python object containing the compiled Jinja2 template.
 
     """
 
-    # Collect the Jinja2-formatted template file attributes.
-    (_, basename) = _get_template_file_attrs(tmpl_path=tmpl_path)
+    # Compile the Jinja2-formatted template string; templates updated
+    # in memory are not written to the Jinja2 bytecode cache.
+    if tmpl_name is None:
+        tmpl = env.from_string(tmpl_str)
+
+        return tmpl
 
-    # Establish the Jinja2 environment.
-    env = _get_env(tmpl_path=tmpl_path)
+    # Load the compiled template from the Jinja2 bytecode cache;
+    # the bytecode cache entry is compared against the checksum of the
+    # template string and the template is compiled only if the entry
+    # does not exist or is no longer valid.
+    bucket = env.bytecode_cache.get_bucket(env, tmpl_name, tmpl_file, tmpl_str)
+    if bucket.code is None:
+        bucket.code = env.compile(tmpl_str, tmpl_name, tmpl_file)
+        env.bytecode_cache.set_bucket(bucket)
 
-    # Define the Jinja2-formatted template.
-    tmpl = env.get_template(basename)
+    tmpl = env.template_class.from_code(env, bucket.code, env.make_globals(None))
 
     return tmpl
 
@@ -344,6 +459,7 @@ def _get_template(tmpl_path: str) -> object:
 # ----
 
 
+@functools.lru_cache(maxsize=1024)
 def _get_template_file_attrs(tmpl_path: str) -> Tuple[str, str]:
     """
     Description
@@ -375,7 +491,7 @@ def _get_template_file_attrs(tmpl_path: str) -> Tuple[str, str]:
     """
 
     # Collect the Jinja2-formatted template file attributes.
-    (dirname, basename) = [os.path.dirname(tmpl_path), os.path.basename(tmpl_path)]
+    (dirname, basename) = os.path.split(tmpl_path)
 
     return (dirname, basename)
 
@@ -383,62 +499,42 @@ def _get_template_file_attrs(tmpl_path: str) -> Tuple[str, str]:
 # ----
 
 
-def _get_template_vars(tmpl_path: str) -> List:
+@functools.lru_cache(maxsize=256)
+def _get_template_vars(env: object, tmpl_str: str) -> FrozenSet[str]:
     """
     Description
     -----------
 
     This function collects the template variable names from a
-    Jinja2-formatted template file.
+    Jinja2-formatted template string; the results are cached using
+    the template string contents such that a template is parsed only
+    once regardless of the number of times it is rendered.
 
     Parameters
     ----------
 
-    tmpl_path: str
+    env: object
 
-        A Python string defining the path to the Jinja2-formatted
-        template file.
+        A Python object containing the Jinja2 environment.
+
+    tmpl_str: str
+
+        A Python string containing the Jinja2-formatted template.
 
     Returns
     -------
 
-    variables: List
+    variables: FrozenSet[str]
 
-        A Python list of Jinja2-formatted template file variables.
+        A Python frozenset of Jinja2-formatted template variables.
 
     """
 
-    # Define the Jinja2 templating attributes.
-    env = _get_env(tmpl_path=tmpl_path)
-    tmpl = _get_template(tmpl_path=tmpl_path)
-
-    # Collect the templated variable names.
-    variables = list(meta.find_undeclared_variables(env.parse(tmpl)))
-
-    # If variables are collected, check again by search for the
-    # Jinja2-formatted template variables; proceed accordingly.
-    if len(variables) == 0:
-
-        # Initialize the variables.
-        variables = []
+    from jinja2 import meta
 
-        start_str = "{{"
-        stop_str = "}}"
-
-        # Collect all data from the Jinja2-formatted file.
-        with open(tmpl_path, "r", encoding="utf-8") as file:
-            data = file.read().split("\n")
-
-        # Search for Jinja2-formatted template variables; proceed
-        # accordingly; ignoring template variable with default values.
-        for item in data:
-            if (start_str and stop_str in item) and ("or" not in item):
-
-                start = item.index(start_str)
-                stop = item.index(stop_str)
-
-                string = (item[start + len(start_str) : stop].rstrip()).lstrip()
-                variables.append(string)
+    # Parse the Jinja2-formatted template and collect the templated
+    # variable names.
+    variables = frozenset(meta.find_undeclared_variables(env.parse(tmpl_str)))
 
     return variables
 
@@ -446,61 +542,96 @@ def _get_template_vars(tmpl_path: str) -> List:
 # ----
 
 
-def _replace_tmplmarkers(tmpl_path: str) -> str:
+def _replace_tmplmarkers(tmpl_str: str) -> str:
     """
     Description
     -----------
 
     This function replaces specified non-Jinja2-formatted template
     string-values with the respective Jinja2-formatted template
-    indicators; the updated template file is written to a temporary
-    (e.g., virtual) file path and returned to the calling function;
-    the non-Jinja2-formatted template string-values are defined bu the
-    `confs/template_interface.py` module attribute `TMPL_ITEM_LIST`.
+    indicators and returns the updated template string to the calling
+    function; the non-Jinja2-formatted template string-values are
+    defined bu the `confs/template_interface.py` module attribute
+    `TMPL_ITEM_LIST`.
 
     Parameters
     ----------
 
-    tmpl_path: str
+    tmpl_str: str
 
-        A Python string defining the path to the template file
-        containing non-Jinja2-formatted template string-values.
+        A Python string containing the template with
+        non-Jinja2-formatted template string-values.
 
     Returns
     -------
 
-    virtfile: str
+    tmpl_str: str
 
-        A Python string defining the path to the temporary (i.e.,
-        virtual) file path containing the Jinja2-formatted template
-        defined from the attributes contained within `tmpl_path` upon
+        A Python string containing the Jinja2-formatted template
+        defined from the attributes contained within `tmpl_str` upon
         entry.
 
     """
 
-    # Read the non-Jinja2-formatted template file.
-    with open(tmpl_path, "r", encoding="utf-8") as file:
-        inputs = file.read().split("\n")
-
-    # Parse the contents of the non-Jinja2-formatted template file;
-    # update any encountered non-Jinja2-formatted template
+    # Update any encountered non-Jinja2-formatted template
     # string-values with the appropriate Jinja2-formatted template
-    # string-values.
-    virtfile = fileio_interface.virtual_file().name
+    # string-values; all template markers are replaced within a single
+    # pass over the template contents.
+    tmpl_str = TMPL_MARKER_REGEX.sub(
+        lambda match: f"{{{{ {match.group(match.lastindex)} }}}}", tmpl_str
+    )
+
+    return tmpl_str
+
+
+# ----
+
 
-    with open(virtfile, "w", encoding="utf-8") as file:
-        for string in inputs:
-            for item in TMPL_ITEM_LIST:
-                tmplstr = item.split("%s")
+def compile_templates(tmpl_dir: str) -> None:
+    """
+    Description
+    -----------
 
-                if (tmplstr[0] in string) and (tmplstr[1] in string):
-                    string = string.replace(tmplstr[0].strip(), "{{ ")
-                    string = string.replace(tmplstr[1].strip(), " }}")
-                    break
+    This function compiles all Jinja2-formatted templates beneath a
+    specified directory tree path ahead of rendering (e.g., at
+    deployment time); the compiled templates are written to the Jinja2
+    bytecode cache such that subsequent processes need not compile the
+    respective templates; templates that cannot be compiled (e.g.,
+    templates containing non-Jinja2-formatted template markers) are
+    skipped.
 
-            file.write(f"{string}\n")
+    Parameters
+    ----------
 
-    return virtfile
+    tmpl_dir: str
+
+        A Python string defining the directory tree path containing
+        the Jinja2-formatted template files.
+
+    """
+
+    from jinja2 import FileSystemLoader, TemplateSyntaxError
+
+    # Compile each Jinja2-formatted template; each template is
+    # compiled within the Jinja2 environment, and using the template
+    # name, defined by `write_from_template` such that the respective
+    # Jinja2 bytecode cache entries are reused when rendering;
+    # proceed accordingly.
+    for tmpl_name in FileSystemLoader(searchpath=tmpl_dir).list_templates():
+        tmpl_path = os.path.abspath(os.path.join(tmpl_dir, tmpl_name))
+        (dirname, basename) = _get_template_file_attrs(tmpl_path=tmpl_path)
+        env = _get_env(dirname=dirname)
+        try:
+            (tmpl_str, tmpl_file, _) = env.loader.get_source(env, basename)
+            _get_template(
+                env=env, tmpl_str=tmpl_str, tmpl_name=basename, tmpl_file=tmpl_file
+            )
+
+        except (TemplateSyntaxError, UnicodeDecodeError) as errmsg:
+            msg = (
+                f"Compiling template {tmpl_path} failed with error {errmsg}; skipping."
+            )
+            logger.warn(msg=msg)
 
 
 # ----
@@ -581,43 +712,78 @@ def write_from_template(
 
     """
 
-    # Format the template and attribute values accordingly.
+    # Collect the Jinja2-formatted template; the template is read only
+    # once and all subsequent template updates and evaluations are
+    # performed in memory; the template file path is normalized such
+    # that the Jinja2 bytecode cache entries do not depend on the
+    # current working directory.
+    tmpl_path = os.path.abspath(tmpl_path)
+    (dirname, basename) = _get_template_file_attrs(tmpl_path=tmpl_path)
+    env = _get_env(dirname=dirname)
+    (tmpl_str, tmpl_file, _) = env.loader.get_source(env, basename)
+    tmpl_update = False
+
+    # Replace any pre-defined template markers; proceed accordingly.
     if rpl_tmpl_mrks:
-        tmpl_path = _replace_tmplmarkers(tmpl_path=tmpl_path)
+        tmpl_str = _replace_tmplmarkers(tmpl_str=tmpl_str)
+        tmpl_update = True
 
+    # Transform the boolean attribute values; a new Python dictionary
+    # is defined such that `in_dict` is not modified upon return.
     if f90_bool:
-        for (key, value) in in_dict.items():
-            in_dict[key] = parser_interface.f90_bool(value)
+        in_dict = {
+            key: (
+                parser_interface.f90_bool(value=value)
+                if isinstance(value, bool)
+                else value
+            )
+            for (key, value) in in_dict.items()
+        }
 
     # Determine what, if any, variables have not been specified with
     # corresponding Python dictionary `in_dict` key and value pairs.
     missing_vars_list = _find_missing_vars(
-        tmpl_path=tmpl_path, in_dict=in_dict, fail_missing=fail_missing
+        env=env, tmpl_str=tmpl_str, in_dict=in_dict, fail_missing=fail_missing
     )
 
-    # Read the original template and remove any strings containing
-    # matches to those in `missing_vars_list`; proceed accordingly.
-    if skip_missing:
-        with open(tmpl_path, "r", encoding="utf-8") as file:
-            tmpl_in_list = file.read().split("\n")
-
-        with open(tmpl_path, "w", encoding="utf-8") as file:
-            for tmpl_var in tmpl_in_list:
-                if not any(
-                    missing_var
-                    for missing_var in missing_vars_list
-                    if missing_var in tmpl_var
-                ):
-                    file.write(f"{tmpl_var}\n")
-
-    # Open the Jinja2-formatted template file, update the Jinja2
-    # template variable(s), and write the results to the output file
-    # path.
+    # Remove any strings within the template containing matches to
+    # those in `missing_vars_list`; the original template file is not
+    # modified; proceed accordingly.
+    if skip_missing and missing_vars_list:
+        missing_vars_regex = re.compile("|".join(map(re.escape, missing_vars_list)))
+        tmpl_str = "\n".join(
+            tmpl_var
+            for tmpl_var in tmpl_str.split("\n")
+            if missing_vars_regex.search(tmpl_var) is None
+        )
+        tmpl_update = True
+
+    # Define the Jinja2-formatted template, update the Jinja2 template
+    # variable(s), and write the results to the output file path; the
+    # template is compiled from the template string read above such
+    # that the rendered template is consistent with the template
+    # variables collected above; if the template has been updated, the
+    # additional trailing newline is retained such that the rendered
+    # output preserves that of the template file.
     try:
-        tmpl = _get_template(tmpl_path=tmpl_path)
+        if tmpl_update:
+            tmpl = _get_template(env=env, tmpl_str=f"{tmpl_str}\n")
+        else:
+            tmpl = _get_template(
+                env=env, tmpl_str=tmpl_str, tmpl_name=basename, tmpl_file=tmpl_file
+            )
 
+        # Stream the rendered template to the output file path rather
+        # than rendering the entire template in memory; if rendering
+        # fails, the partially written output file is removed.
         with open(output_file, "w", encoding="utf-8") as file:
-            file.write(tmpl.render(in_dict, env=os.environ))
+            try:
+                tmpl.stream(in_dict, env=os.environ).dump(file)
+
+            except Exception:
+                file.close()
+                os.unlink(output_file)
+                raise
 
     except Exception as errmsg:
         msg = (
@@ -626,9 +792,6 @@ def write_from_template(
         )
         raise Jinja2InterfaceError(msg=msg)
 
-    if rpl_tmpl_mrks or skip_missing:
-        os.unlink(tmpl_path)
-
 
 # ----
 
@@ -670,17 +833,15 @@ def write_jinja2(jinja2_file: str, in_dict: Dict) -> None:
     logger.info(msg=msg)
 
     try:
-        with open(jinja2_file, "w", encoding="utf-8") as file:
-            file.write("#!Jinja2\n")
-            for key in in_dict.keys():
-                value = in_dict[key]
+        jinja2_list = ["#!Jinja2\n"]
+        for (key, value) in in_dict.items():
+            if isinstance(value, str):
+                value = f'"{value}"'
 
-                if isinstance(value, str):
-                    string = f'set {key} = "{value}"'
-                else:
-                    string = f"set {key} = {value}"
+            jinja2_list.append(f"{{% set {key} = {value} %}}\n")
 
-                file.write("{%% %s %%}\n" % string)
+        with open(jinja2_file, "w", encoding="utf-8") as file:
+            file.write("".join(jinja2_list))
 
     except Exception as errmsg:
         msg = f"Writing Jinja2-formatted file {jinja2_file} failed with error {errmsg}. Aborting!!!"
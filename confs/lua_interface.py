@@ -26,6 +26,11 @@ Functions
         This function appends an `end-of-line` to the LUA string
         specified upon entry.
 
+    __author()
+
+        This function returns the user name to be written to the LUA
+        formatted statement string header.
+
     __conflict(lua_dict)
 
         This function defines a LUA formatted `conflict` statement(s).
@@ -77,19 +82,16 @@ History
 
 # ----
 
-# pylint: disable=consider-using-f-string
-
-# ----
-
 __author__ = "Henry R. Winterbottom"
 __maintainer__ = "Henry R. Winterbottom"
 __email__ = "henry.winterbottom@noaa.gov"
 
 # ----
 
+import functools
 from typing import Dict, Union
 
-from tools import datetime_interface, parser_interface, system_interface
+from tools import datetime_interface, system_interface
 from utils.logger_interface import Logger
 
 # ----
@@ -138,6 +140,34 @@ def __append(lua_str: str) -> str:
 # ----
 
 
+@functools.lru_cache(maxsize=1)
+def __author() -> str:
+    """
+    Description
+    -----------
+
+    This function returns the user name to be written to the LUA
+    formatted statement string header; the user name is invariant for
+    a given process and is therefore determined only once.
+
+    Returns
+    -------
+
+    author: str
+
+        A Python string specifying the user name.
+
+    """
+
+    # Define the user name.
+    author = system_interface.user()
+
+    return author
+
+
+# ----
+
+
 def __conflict(lua_dict: Dict) -> Union[str, None]:
     """
     Description
@@ -164,13 +194,10 @@ def __conflict(lua_dict: Dict) -> Union[str, None]:
 
     # Build the LUA `conflict` attributes.
     try:
-        lua_str = "-- Conflict(s).\n"
-        conflicts_list = parser_interface.dict_key_value(
-            dict_in=lua_dict, key="conflicts", force=True, no_split=True
-        )
-        for conflict in conflicts_list:
-            lua_str = lua_str + 'conflict("{}")\n'.format(conflict)
-        lua_str = __append(lua_str=lua_str)
+        conflicts_list = lua_dict.get("conflicts")
+        lua_list = ["-- Conflict(s).\n"]
+        lua_list.extend(f'conflict("{conflict}")\n' for conflict in conflicts_list)
+        lua_str = __append(lua_str="".join(lua_list))
     except TypeError:
         return None
 
@@ -205,13 +232,11 @@ def __description(lua_dict: Dict) -> Union[str, None]:
     """
 
     # Build the LUA `description` attributes.
-    value = parser_interface.dict_key_value(
-        dict_in=lua_dict, key="description", force=True, no_split=True
-    )
+    value = lua_dict.get("description")
     if value is not None:
-        lua_str = """\
+        lua_str = f"""\
 --
--- {lua_description}
+-- {value}
 --
 
 local pkgName = myModuleName()
@@ -220,11 +245,11 @@ local pkgNameVer = myModuleFullName()
 
 whatis("Name: " .. pkgName)
 whatis("Version: " ... pkgVersion)
-whatis("Description: {lua_description}")
-""".format(
-            lua_description=value
-        )
-    lua_str = __append(lua_str=lua_str)
+whatis("Description: {value}")
+"""
+        lua_str = __append(lua_str=lua_str)
+    else:
+        return None
 
     return lua_str
 
@@ -258,13 +283,10 @@ def __family(lua_dict: Dict) -> Union[str, None]:
 
     # Build the LUA `family` attributes.
     try:
-        lua_str = "-- Family.\n"
-        family_list = parser_interface.dict_key_value(
-            dict_in=lua_dict, key="family", force=True, no_split=True
-        )
-        for family in family_list:
-            lua_str = lua_str + 'family("{}")\n'.format(family)
-        lua_str = __append(lua_str=lua_str)
+        family_list = lua_dict.get("family")
+        lua_list = ["-- Family.\n"]
+        lua_list.extend(f'family("{family}")\n' for family in family_list)
+        lua_str = __append(lua_str="".join(lua_list))
     except TypeError:
         return None
 
@@ -299,17 +321,13 @@ def __help(lua_dict: Dict) -> Union[str, None]:
     """
 
     # Build the LUA `help` attributes.
-    value = parser_interface.dict_key_value(
-        dict_in=lua_dict, key="help", force=True, no_split=True
-    )
+    value = lua_dict.get("help")
     if value is not None:
-        lua_str = """\
+        lua_str = f"""\
 help([[
-{lua_help}
+{value}
 ]])
-""".format(
-            lua_help=value
-        )
+"""
         lua_str = __append(lua_str=lua_str)
     else:
         return None
@@ -338,16 +356,14 @@ def __initlua() -> str:
     """
 
     # Initialize the LUA statement strings accordingly.
-    lua_str = """\
+    timestamp = datetime_interface.current_date(
+        frmttyp="%Y-%m-%d %H:%M:%S", is_utc=True
+    )
+    lua_str = f"""\
 -- -*- lua -*-
--- Author: {author}
+-- Author: {__author()}
 -- Created: {timestamp}
-""".format(
-        timestamp=datetime_interface.current_date(
-            frmttyp="%Y-%m-%d %H:%M:%S", is_utc=True
-        ),
-        author=system_interface.user(),
-    )
+"""
     lua_str = __append(lua_str=lua_str)
 
     return lua_str
@@ -381,30 +397,16 @@ def __load(lua_dict: Dict) -> Union[str, None]:
     """
 
     # Build the LUA `load` attributes.
-    load_list = parser_interface.dict_key_value(
-        dict_in=lua_dict, key="load", force=True, no_split=True
-    )
+    load_list = lua_dict.get("load")
     if load_list is not None:
-        lua_str = "-- Load packages and versions.\n"
+        lua_list = ["-- Load packages and versions.\n"]
         for item in load_list:
             if isinstance(item, str):
-                lua_str = (
-                    lua_str
-                    + """\
-load(\"{item}\")\n""".format(
-                        item=item
-                    )
-                )
+                lua_list.append(f'load("{item}")\n')
             if isinstance(item, dict):
                 for (key, value) in item.items():
-                    lua_str = (
-                        lua_str
-                        + """\
-load(pathJoin(\"{key}\", \"{value}\"))\n""".format(
-                            key=key, value=value
-                        )
-                    )
-        lua_str = __append(lua_str=lua_str)
+                    lua_list.append(f'load(pathJoin("{key}", "{value}"))\n')
+        lua_str = __append(lua_str="".join(lua_list))
     else:
         return None
 
@@ -439,16 +441,13 @@ def __prepend_path(lua_dict: Dict) -> Union[str, None]:
     """
 
     # Build the LUA `prepend_path` attributes.
-    prepend_path_dict = parser_interface.dict_key_value(
-        dict_in=lua_dict, key="prepend_path", force=True, no_split=True
-    )
+    prepend_path_dict = lua_dict.get("prepend_path")
     if prepend_path_dict is not None:
-        lua_str = "-- Prepend paths.\n"
+        lua_list = ["-- Prepend paths.\n"]
         for (prepend_key, prepend_value) in prepend_path_dict.items():
-            lua_str = lua_str + 'prepend_path("{}", "{}")\n'.format(
-                prepend_key, '", "'.join(prepend_value)
-            )
-        lua_str = __append(lua_str=lua_str)
+            prepend_str = '", "'.join(prepend_value)
+            lua_list.append(f'prepend_path("{prepend_key}", "{prepend_str}")\n')
+        lua_str = __append(lua_str="".join(lua_list))
     else:
         return None
 
@@ -484,16 +483,14 @@ def __setenv(lua_dict: Dict) -> Union[str, None]:
 
     # Build the LUA `setenv` attributes.
     try:
-        lua_str = "-- Environment variables.\n"
-        setenv_list = parser_interface.dict_key_value(
-            dict_in=lua_dict, key="setenv", force=True, no_split=True
-        )
+        setenv_list = lua_dict.get("setenv")
+        lua_list = ["-- Environment variables.\n"]
         for setenv_dict in setenv_list:
-            for (setenv_key, setenv_value) in setenv_dict.items():
-                lua_str = lua_str + 'setenv("{}", "{}")\n'.format(
-                    setenv_key, setenv_value
-                )
-        lua_str = __append(lua_str=lua_str)
+            lua_list.extend(
+                f'setenv("{setenv_key}", "{setenv_value}")\n'
+                for (setenv_key, setenv_value) in setenv_dict.items()
+            )
+        lua_str = __append(lua_str="".join(lua_list))
     except TypeError:
         return None
 
@@ -537,8 +534,7 @@ def write_lua(lua_dict: Dict, lua_path: str) -> None:
     msg = f"Creating LUA-formatted file path {lua_path}."
     logger.info(msg=msg)
     with open(lua_path, "w", encoding="utf-8") as lua_out:
-        lua_str = __initlua()
-        for function in function_list:
-            if function is not None:
-                lua_str = lua_str + function
-        lua_out.write(lua_str)
+        lua_out.write(__initlua())
+        lua_out.writelines(
+            function for function in function_list if function is not None
+        )
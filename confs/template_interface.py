@@ -36,6 +36,16 @@ Classes
 
         This is the base-class object for all file template rendering.
 
+Functions
+---------
+
+    _read_tmpl(tmpl_path, tmpl_mtime, tmpl_size)
+
+        This function reads a template file path and returns a Python
+        string containing the attributes collected from the file; the
+        results are cached for each template file path modification
+        time and size.
+
 Author(s)
 ---------
 
@@ -60,7 +70,10 @@ __email__ = "henry.winterbottom@noaa.gov"
 
 # -----
 
-from typing import Dict
+import functools
+import os
+import re
+from typing import Dict, List
 
 from tools import parser_interface
 from utils.decorator_interface import privatemethod
@@ -80,6 +93,72 @@ TMPL_ITEM_LIST = [
     "{{ %s }}",
 ]
 
+# Define the regular expression to be used to collect all template
+# strings; each template string within `TMPL_ITEM_LIST` is an
+# alternative within the regular expression and the attribute name is
+# collected from the respective group; attribute names may not contain
+# white-space or any of the characters that delimit a template
+# string.
+TMPL_REGEX = re.compile(
+    "|".join(
+        rf"{re.escape(start_str.replace('%%', '%'))}"
+        r"([^\s<>\[\]{}@%]+)"
+        rf"{re.escape(stop_str.replace('%%', '%'))}"
+        for (start_str, stop_str) in (item.split("%s") for item in TMPL_ITEM_LIST)
+    )
+)
+
+# ----
+
+
+@functools.lru_cache(maxsize=64)
+def _read_tmpl(tmpl_path: str, tmpl_mtime: int, tmpl_size: int) -> str:
+    """
+    Description
+    -----------
+
+    This function reads a template file path and returns a Python
+    string containing the attributes collected from the file; the
+    results are cached for each template file path modification time
+    and size such that an updated template file path is read again.
+
+    Parameters
+    ----------
+
+    tmpl_path: str
+
+        A Python string defining the template file path.
+
+    tmpl_mtime: int
+
+        A Python integer specifying the template file path
+        modification time (in nanoseconds); this is used only as a
+        cache key.
+
+    tmpl_size: int
+
+        A Python integer specifying the template file path size (in
+        bytes); this is used only as a cache key.
+
+    Returns
+    -------
+
+    tmpl_str_in: str
+
+        A Python string containing the attributes collected from the
+        template file path.
+
+    """
+
+    # Read and return the attributes within the template file path;
+    # this is equivalent to joining each line of the template file,
+    # terminated by an `end-of-line`, with a single space.
+    with open(tmpl_path, "r", encoding="utf-8") as file:
+        tmpl_str_in = file.read().replace("\n", "\n ") + "\n"
+
+    return tmpl_str_in
+
+
 # ----
 
 
@@ -130,10 +209,14 @@ class Template:
         """
 
         # Read and return the attributes within the template file
-        # path.
-        with open(tmpl_path, "r", encoding="utf-8") as file:
-            tmpl_str = file.read().split("\n")
-        tmpl_str_in = " ".join([f"{item}\n" for item in tmpl_str])
+        # path; the template file path is read only if it has not
+        # been read previously or has since been updated.
+        tmpl_stat = os.stat(tmpl_path)
+        tmpl_str_in = _read_tmpl(
+            tmpl_path=os.path.realpath(tmpl_path),
+            tmpl_mtime=tmpl_stat.st_mtime_ns,
+            tmpl_size=tmpl_stat.st_size,
+        )
 
         return tmpl_str_in
 
@@ -192,45 +275,36 @@ class Template:
 
         """
 
-        # Initialize the output string.
-        tmpl_str_out = tmpl_str_in
+        # Collect the attributes with which to render the template
+        # string; transform boolean variables accordingly.
+        attrs_dict = {
+            attr_key: (
+                str(parser_interface.f90_bool(value=attr_value))
+                if f90_bool
+                else str(attr_value)
+            )
+            for (attr_key, attr_value) in vars(tmpl_obj).items()
+            if attr_value is not None
+        }
 
         # Replace any instances of templated strings with specified
-        # attributes accordingly.
-        for (attr_key, attr_value) in vars(tmpl_obj).items():
-            for tmpl_item in TMPL_ITEM_LIST:
-
-                try:
-                    check_str = tmpl_item % attr_key
-                    value = parser_interface.dict_key_value(
-                        dict_in=vars(tmpl_obj), key=attr_key, force=True, no_split=True
-                    )
-
-                    # Update value accordingly.
-                    if value is not None:
-                        if f90_bool:
-                            value = parser_interface.f90_bool(value=value)
-                        attr_value = value
-
-                        tmpl_str_out = tmpl_str_out.replace(check_str, str(attr_value))
-
-                except TypeError:
-                    pass
-
-        # Define all characters that represent templated values.
-        tmpl_char_list = set(
-            list("".join([item.replace("%s", "") for item in TMPL_ITEM_LIST]))
-        )
+        # attributes accordingly; templated strings for which no
+        # attribute has been specified are collected and otherwise
+        # remain unaltered.
+        tmpl_str_list = []
+
+        def _render(match: re.Match) -> str:
+            attr_value = attrs_dict.get(match.group(match.lastindex))
+            if attr_value is None:
+                tmpl_str_list.append(match.group(0))
+                return match.group(0)
 
-        tmpl_char_list = [item for item in tmpl_char_list if item != " "]
+            return attr_value
+
+        tmpl_str_out = TMPL_REGEX.sub(_render, tmpl_str_in)
 
         # Check whether any templated strings remain; proceed
         # accordingly.
-        tmpl_str_list = []
-        for tmpl_str in tmpl_str_out.split("\n"):
-            if any(item for item in tmpl_char_list if item in tmpl_str):
-                tmpl_str_list.append(tmpl_str.strip())
-
         msg = (
             "The following template(s) was (were) not rendered: "
             f"{', '.join(tmpl_str_list)}."
@@ -276,17 +350,44 @@ class Template:
         # Collect the attributes within the Python dictionary provided
         # upon entry and builds a Python object.
         tmpl_obj = parser_interface.object_define()
-        for attr in attr_dict.keys():
-            value = parser_interface.dict_key_value(
-                dict_in=attr_dict, key=attr, no_split=True
-            )
-
+        for (attr, value) in attr_dict.items():
             tmpl_obj = parser_interface.object_setattr(
                 object_in=tmpl_obj, key=attr, value=value
             )
 
         return tmpl_obj
 
+    @privatemethod
+    def write_out(self: object, tmpl_str_out: str, tmpl_path: str) -> None:
+        """
+        Description
+        -----------
+
+        This method writes a rendered template string to a specified
+        file path; leading and trailing white-space is removed from
+        each line of the rendered template string.
+
+        Parameters
+        ----------
+
+        tmpl_str_out: str
+
+            A Python string for which template characters have been
+            rendered.
+
+        tmpl_path: str
+
+            A Python string specifying the rendered (e.g., output)
+            file path.
+
+        """
+
+        # Write out the template.
+        with open(tmpl_path, "w", encoding="utf-8") as file:
+            file.write(
+                "\n".join(item.strip() for item in tmpl_str_out.split("\n")) + "\n"
+            )
+
     def write_tmpl(
         self: object,
         attr_dict: Dict,
@@ -350,6 +451,89 @@ class Template:
         )
 
         # Write out the template.
-        with open(tmpl_path, "w", encoding="utf-8") as file:
-            for item in tmpl_str_out.split("\n"):
-                file.write(f"{item.strip()}\n")
+        self.write_out(tmpl_str_out=tmpl_str_out, tmpl_path=tmpl_path)
+
+    def write_tmpl_batch(
+        self: object,
+        attr_dict_list: List[Dict],
+        tmpl_path_list: List[str],
+        template_path: str,
+        fail_missing: bool = False,
+        f90_bool: bool = False,
+    ) -> None:
+        """
+        Description
+        -----------
+
+        This method renders a single template file path for each of
+        the specified collections of attribute values and writes each
+        updated template to the respective file path; the template
+        file path is read only once.
+
+        Parameters
+        ----------
+
+        attr_dict_list: List[Dict]
+
+            A Python list of Python dictionaries containing the
+            attributes to be used for updating the specified template;
+            each dictionary corresponds to the respective element of
+            `tmpl_path_list`.
+
+        tmpl_path_list: List[str]
+
+            A Python list of Python strings specifying the rendered
+            (e.g., output) file paths.
+
+        template_path: str
+
+            A Python string specifying the template file path to be
+            rendered.
+
+        Keywords
+        --------
+
+        fail_missing: bool, optional
+
+            A Python boolean valued variable specifying whether to
+            fail if a template string cannot be fully rendered.
+
+        f90_bool: bool, optional
+
+            A Python boolean valued variable specifying whether to
+            transform boolean variables to a FORTRAN 90 format.
+
+        Raises
+        ------
+
+        TemplateInterfaceError
+
+            - raised if the lengths of `attr_dict_list` and
+              `tmpl_path_list` differ upon entry.
+
+        """
+
+        # Check that each collection of attributes corresponds to an
+        # output file path; proceed accordingly.
+        if len(attr_dict_list) != len(tmpl_path_list):
+            msg = (
+                f"The number of attribute collections ({len(attr_dict_list)}) "
+                f"does not match the number of output file paths "
+                f"({len(tmpl_path_list)}). Aborting!!!"
+            )
+            raise TemplateInterfaceError(msg=msg)
+
+        # Read the template file.
+        tmpl_str_in = self.read_tmpl(tmpl_path=template_path)
+
+        # Render and write out the template for each collection of
+        # attributes.
+        for (attr_dict, tmpl_path) in zip(attr_dict_list, tmpl_path_list):
+            tmpl_obj = self.tmpl_obj(attr_dict=attr_dict)
+            tmpl_str_out = self.render_tmpl(
+                tmpl_obj=tmpl_obj,
+                tmpl_str_in=tmpl_str_in,
+                fail_missing=fail_missing,
+                f90_bool=f90_bool,
+            )
+            self.write_out(tmpl_str_out=tmpl_str_out, tmpl_path=tmpl_path)
@@ -59,6 +59,7 @@ History
 
 # ----
 
+# pylint: disable=protected-access
 # pylint: disable=undefined-variable
 
 # ----
@@ -70,10 +71,13 @@ __email__ = "henry.winterbottom@noaa.gov"
 # ----
 
 import os
-from unittest import TestCase
+import tempfile
+from unittest import TestCase, mock
 
 import pytest
+from jinja2 import Environment
 from tools import fileio_interface
+from utils.exceptions_interface import Jinja2InterfaceError
 
 from confs import jinja2_interface
 
@@ -90,48 +94,123 @@ class TestJinja2Methods(TestCase):
 
     """
 
-    def setUp(self: TestCase) -> None:
+    @classmethod
+    def setUpClass(cls: TestCase) -> None:
         """
         Description
         -----------
 
         This method defines the base-class attributes for all
-        jinja2_interface unit-tests.
+        jinja2_interface unit-tests; the attributes are not modified by
+        the respective unit-tests and are therefore defined only once.
 
         """
 
         # Define the base-class attributes.
-        self.jinja2_test_dict = {"NAME1": "ham", "NAME2": "eggs", "NAME3": "spam"}
+        cls.jinja2_test_dict = {"NAME1": "ham", "NAME2": "eggs", "NAME3": "spam"}
 
-        # Define the file paths required for the test method(s).
+        # Define the file paths required for the test method(s); the
+        # test files are written to a temporary directory tree path
+        # such that concurrent unit-tests do not collide.
         dirpath = os.path.join(os.getcwd(), "tests")
-        self.jinja2_template = os.path.join(dirpath, "test_files", "jinja2.template")
-        self.jinja2_check = os.path.join(dirpath, "test_files", "jinja2.check")
-        self.jinja2_file = os.path.join(dirpath, "jinja2.test")
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.jinja2_template = os.path.join(dirpath, "test_files", "jinja2.template")
+        cls.jinja2_check = os.path.join(dirpath, "test_files", "jinja2.check")
+        cls.jinja2_file = os.path.join(cls.tmp_dir, "jinja2.test")
 
         # Define the message to accompany any unit-test failures.
-        self.unit_test_msg = "The unit-test for jinja2_interface failed."
+        cls.unit_test_msg = "The unit-test for jinja2_interface failed."
 
-    @pytest.mark.order(100)
-    def test_cleanup(self: TestCase) -> None:
+    @classmethod
+    def tearDownClass(cls: TestCase) -> None:
         """
         Description
         -----------
 
-        This method removes the test files used for the respective
-        jinja2_interface function unit-tests; it is not an actual
-        unit-test but is simply used to remove the test files file
-        following the completion of the actual (i.e., valid)
-        unit-tests; this should be the last test that is executed by
-        pytest.
+        This method removes the temporary directory tree path, and
+        the test files therein, used for the respective
+        jinja2_interface unit-tests.
+
+        """
+
+        # Remove the temporary directory tree path.
+        fileio_interface.rmdir(path=cls.tmp_dir)
 
+    @pytest.mark.order(3)
+    def test_compile_templates(self: TestCase) -> None:
         """
+        Description
+        -----------
+
+        This method provides a unit-test for the jinja2_interface
+        module `compile_templates` function.
+
+        """
+
+        # Define the Jinja2 bytecode cache directory tree path; the
+        # cached Jinja2 objects are reset such that the bytecode cache
+        # directory tree path is used.
+        bytecode_cache_dir = os.path.join(self.tmp_dir, "bytecode_cache")
+        self.addCleanup(self._clear_caches)
+        self._clear_caches()
+
+        # Define the template directory tree path; this includes a
+        # template within a sub-directory and a template which cannot
+        # be compiled and is to be skipped.
+        tmpl_dir = os.path.join(self.tmp_dir, "templates")
+        fileio_interface.makedirs(path=os.path.join(tmpl_dir, "sub"))
+        for (tmpl_name, tmpl_str) in [
+            ("top.j2", "{{ NAME1 }}"),
+            (os.path.join("sub", "nested.j2"), "{{ NAME2 }}"),
+            ("invalid.j2", "{% if %}"),
+        ]:
+            with open(os.path.join(tmpl_dir, tmpl_name), "w", encoding="utf-8") as file:
+                file.write(tmpl_str)
+
+        with mock.patch.dict(os.environ, {"JINJA2_BYTECODE_CACHE": bytecode_cache_dir}):
+            # Compile the templates within the template directory tree
+            # path.
+            jinja2_interface.compile_templates(tmpl_dir=tmpl_dir)
+            cache_list = sorted(os.listdir(bytecode_cache_dir))
+            assert len(cache_list) == 2, self.unit_test_msg
+
+            # Render the templates, specified by absolute and relative
+            # paths, from a new template cache; the templates must
+            # not be compiled again and no additional Jinja2 bytecode
+            # cache entries may be written.
+            jinja2_interface._get_template.cache_clear()
+            with mock.patch.object(Environment, "compile") as compile_mock:
+                for tmpl_path in [
+                    os.path.join(tmpl_dir, "top.j2"),
+                    os.path.relpath(os.path.join(tmpl_dir, "sub", "nested.j2")),
+                ]:
+                    jinja2_interface.write_from_template(
+                        tmpl_path=tmpl_path,
+                        output_file=self.jinja2_file,
+                        in_dict=self.jinja2_test_dict,
+                        fail_missing=True,
+                    )
+
+            compile_mock.assert_not_called()
+            assert (
+                sorted(os.listdir(bytecode_cache_dir)) == cache_list
+            ), self.unit_test_msg
+
+    @staticmethod
+    def _clear_caches() -> None:
+        """
+        Description
+        -----------
 
-        # Define the list of (the) test file(s) to be removed.
-        filelist = [self.jinja2_file]
+        This method clears the cached jinja2_interface Jinja2
+        bytecode cache, environment, and template objects.
 
-        # Remove the specified files.
-        fileio_interface.removefiles(filelist=filelist)
+        """
+
+        # Clear the cached Jinja2 objects.
+        jinja2_interface._get_bytecode_cache.cache_clear()
+        jinja2_interface._get_env.cache_clear()
+        jinja2_interface._get_template.cache_clear()
 
     @pytest.mark.order(1)
     def test_write_from_template(self: TestCase) -> None:
@@ -159,11 +238,138 @@ class TestJinja2Methods(TestCase):
         # Jinja2-formatted file.
         with open(self.jinja2_check, "r", encoding="utf-8") as file:
             jinja2_check = file.read().rstrip()
-        with open(self.jinja2_check, "r", encoding="utf-8") as file:
+        with open(self.jinja2_file, "r", encoding="utf-8") as file:
             jinja2_file = file.read().rstrip()
 
         assert jinja2_check == jinja2_file, self.unit_test_msg
 
+    @pytest.mark.order(4)
+    def test_write_from_template_modified(self: TestCase) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the jinja2_interface
+        module `write_from_template` function when the
+        Jinja2-formatted template file is modified between renderings.
+
+        """
+
+        # Define the Jinja2-formatted template file path.
+        tmpl_path = os.path.join(self.tmp_dir, "modified.template")
+
+        # Render the Jinja2-formatted template file, modify the
+        # template file, and render the template file again; the
+        # second rendering must reflect the modified template file.
+        for (tmpl_str, in_dict, check_str) in [
+            ("Hello {{ A }}", {"A": 1}, "Hello 1"),
+            ("Bye {{ B }}", {"B": 2}, "Bye 2"),
+        ]:
+            with open(tmpl_path, "w", encoding="utf-8") as file:
+                file.write(tmpl_str)
+
+            jinja2_interface.write_from_template(
+                tmpl_path=tmpl_path,
+                output_file=self.jinja2_file,
+                in_dict=in_dict,
+                fail_missing=True,
+            )
+
+            with open(self.jinja2_file, "r", encoding="utf-8") as file:
+                assert file.read() == check_str, self.unit_test_msg
+
+    @pytest.mark.order(5)
+    def test_write_from_template_rpl_tmpl_mrks(self: TestCase) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the jinja2_interface
+        module `write_from_template` function when the
+        non-Jinja2-formatted template markers are to be replaced;
+        native Jinja2-formatted expressions (e.g., whitespace control)
+        must not be modified.
+
+        """
+
+        # Define the template file containing non-Jinja2-formatted
+        # template markers and a Jinja2-formatted whitespace control
+        # expression.
+        tmpl_path = os.path.join(self.tmp_dir, "rpl_tmpl_mrks.template")
+        with open(tmpl_path, "w", encoding="utf-8") as file:
+            file.write("@[NAME1] and <NAME2>\n  {{- NAME3 -}}  \nend")
+
+        # Write the Jinja2-formatted file from the template file.
+        jinja2_interface.write_from_template(
+            tmpl_path=tmpl_path,
+            output_file=self.jinja2_file,
+            in_dict=self.jinja2_test_dict,
+            fail_missing=True,
+            rpl_tmpl_mrks=True,
+        )
+
+        # Compare the generated Jinja2-formatted file to the expected
+        # file contents.
+        with open(self.jinja2_file, "r", encoding="utf-8") as file:
+            assert file.read() == "ham and eggsspamend", self.unit_test_msg
+
+    @pytest.mark.order(6)
+    def test_write_from_template_render_error(self: TestCase) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the jinja2_interface
+        module `write_from_template` function when an exception is
+        raised while rendering the Jinja2-formatted template; the
+        partially written output file must be removed.
+
+        """
+
+        # Define the Jinja2-formatted template file; the template
+        # cannot be rendered beyond the first line.
+        tmpl_path = os.path.join(self.tmp_dir, "render_error.template")
+        with open(tmpl_path, "w", encoding="utf-8") as file:
+            file.write("{{ NAME1 }}\n{{ NAME4.missing() }}\n")
+
+        # Check that the rendering exception is raised and that no
+        # output file remains.
+        output_file = os.path.join(self.tmp_dir, "render_error.test")
+        with pytest.raises(Jinja2InterfaceError):
+            jinja2_interface.write_from_template(
+                tmpl_path=tmpl_path,
+                output_file=output_file,
+                in_dict=self.jinja2_test_dict,
+            )
+
+        assert not os.path.exists(output_file), self.unit_test_msg
+
+    @pytest.mark.order(2)
+    def test_write_from_template_fail_missing(self: TestCase) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the jinja2_interface
+        module `write_from_template` function when Jinja2-formatted
+        template variables have not been specified.
+
+        """
+
+        # Define a Python dictionary missing Jinja2-formatted template
+        # variables other than the first within the template file.
+        in_dict = {"NAME3": "spam"}
+
+        # Check that the missing Jinja2-formatted template variables
+        # are identified.
+        with pytest.raises(Jinja2InterfaceError):
+            jinja2_interface.write_from_template(
+                tmpl_path=self.jinja2_template,
+                output_file=self.jinja2_file,
+                in_dict=in_dict,
+                fail_missing=True,
+            )
+
 
 # ----
 
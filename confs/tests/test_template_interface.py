@@ -69,6 +69,7 @@ __email__ = "henry.winterbottom@noaa.gov"
 # ----
 
 import os
+import tempfile
 from collections import OrderedDict
 from unittest import TestCase
 
@@ -91,18 +92,20 @@ class TestTemplateMethods(TestCase):
 
     """
 
-    def setUp(self: TestCase) -> None:
+    @classmethod
+    def setUpClass(cls: TestCase) -> None:
         """
         Description
         -----------
 
         This method defines the base-class attributes for all
-        template_interface unit-tests.
+        template_interface unit-tests; the attributes are not modified by
+        the respective unit-tests and are therefore defined only once.
 
         """
 
         # Define the base-class attributes.
-        self.tmpl1_dict = OrderedDict(
+        cls.tmpl1_dict = OrderedDict(
             {
                 "EGGS": 2,
                 "HAM": 1,
@@ -112,7 +115,7 @@ class TestTemplateMethods(TestCase):
             }
         )
 
-        self.tmpl2_dict = OrderedDict(
+        cls.tmpl2_dict = OrderedDict(
             {
                 "EGGS": 2,
                 "HAM": 1,
@@ -122,35 +125,35 @@ class TestTemplateMethods(TestCase):
             }
         )
 
-        # Define the file paths required for the test method(s).
+        # Define the file paths required for the test method(s); the
+        # test files are written to a temporary directory tree path
+        # such that concurrent unit-tests do not collide.
         dirpath = os.path.join(os.getcwd(), "tests")
-        self.tmpl_check = os.path.join(dirpath, "test_files", "template.check")
-        self.tmpl_path = os.path.join(dirpath, "template.test")
-        self.template_path = os.path.join(dirpath, "test_files", "template.template")
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.tmpl_check = os.path.join(dirpath, "test_files", "template.check")
+        cls.tmpl_path = os.path.join(cls.tmp_dir, "template.test")
+        cls.tmpl_batch_path_list = [
+            os.path.join(cls.tmp_dir, f"template.batch{idx}.test") for idx in range(2)
+        ]
+        cls.template_path = os.path.join(dirpath, "test_files", "template.template")
 
         # Define the message to accompany any unit-test failures.
-        self.unit_test_msg = "The unit-test for template_interface failed."
+        cls.unit_test_msg = "The unit-test for template_interface failed."
 
-    @pytest.mark.order(100)
-    def test_cleanup(self: TestCase) -> None:
+    @classmethod
+    def tearDownClass(cls: TestCase) -> None:
         """
         Description
         -----------
 
-        This method removes the test files used for the respective
-        template_interface function unit-tests; it is not an actual
-        unit-test but is simply used to remove the test files file
-        following the completion of the actual (i.e., valid)
-        unit-tests; this should be the last test that is executed by
-        pytest.
+        This method removes the temporary directory tree path, and
+        the test files therein, used for the respective
+        template_interface unit-tests.
 
         """
 
-        # Define the list of (the) test file(s) to be removed.
-        filelist = [self.tmpl_path]
-
-        # Remove the specified files.
-        fileio_interface.removefiles(filelist=filelist)
+        # Remove the temporary directory tree path.
+        fileio_interface.rmdir(path=cls.tmp_dir)
 
     @pytest.mark.order(1)
     def test_template(self: TestCase) -> None:
@@ -180,18 +183,69 @@ class TestTemplateMethods(TestCase):
 
         assert set(tmpl_check) == set(tmpl_path), self.unit_test_msg
 
-        try:
+        # Write the output file using the input template and
+        # transform the boolean variables to a FORTRAN 90 format.
+        Template().write_tmpl(
+            attr_dict=self.tmpl2_dict,
+            tmpl_path=self.tmpl_path,
+            template_path=self.template_path,
+            f90_bool=True,
+            fail_missing=True,
+        )
+
+        with open(self.tmpl_path, "r", encoding="utf-8") as file:
+            assert "Just ham? T" in file.read(), self.unit_test_msg
+
+        # Check that template strings which cannot be rendered are
+        # identified.
+        attr_dict = {
+            key: value for (key, value) in self.tmpl1_dict.items() if key != "DINNER"
+        }
+        with pytest.raises(TemplateInterfaceError):
             Template().write_tmpl(
-                attr_dict=self.tmpl2_dict,
+                attr_dict=attr_dict,
                 tmpl_path=self.tmpl_path,
                 template_path=self.template_path,
-                f90_bool=True,
                 fail_missing=True,
             )
-            assert True
 
-        except TemplateInterfaceError:
-            assert True
+    @pytest.mark.order(2)
+    def test_template_batch(self: TestCase) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the template_interface
+        module batch rendering method.
+
+        """
+
+        # Write the output files using the input template.
+        Template().write_tmpl_batch(
+            attr_dict_list=[self.tmpl1_dict, self.tmpl2_dict],
+            tmpl_path_list=self.tmpl_batch_path_list,
+            template_path=self.template_path,
+            f90_bool=False,
+            fail_missing=True,
+        )
+
+        # Read the generated file and the example template file.
+        with open(self.tmpl_check, "r", encoding="utf-8") as file:
+            tmpl_check = file.read().rstrip().split("\n")
+        with open(self.tmpl_batch_path_list[0], "r", encoding="utf-8") as file:
+            tmpl_path = file.read().rstrip().split("\n")
+
+        assert set(tmpl_check) == set(tmpl_path), self.unit_test_msg
+
+        with open(self.tmpl_batch_path_list[1], "r", encoding="utf-8") as file:
+            assert "Just ham? True" in file.read(), self.unit_test_msg
+
+        with pytest.raises(TemplateInterfaceError):
+            Template().write_tmpl_batch(
+                attr_dict_list=[self.tmpl1_dict],
+                tmpl_path_list=self.tmpl_batch_path_list,
+                template_path=self.template_path,
+            )
 
 
 # ----
@@ -60,11 +60,24 @@ Functions
         their respective MKS representations and returns a Python
         object containing the respective scaled values.
 
+    scale_tcvrecs(tcv_dict_list)
+
+        This function scales the relevant tropical cyclone records for
+        a collection of TC-vitals records to their respective MKS
+        representations and returns a Python object containing arrays
+        of the respective scaled values.
+
     write_tcvfile(filepath, tcvstr)
 
         This function writes a user-specified TC-vitals record(s) to a
         specified filepath.
 
+    write_tcvrecs(filepath, tcvit_obj_list)
+
+        This function builds and writes the TC-vitals records for a
+        collection of TC-vitals record attribute objects to a
+        specified filepath.
+
     write_tcvstr(tcvit_obj)
 
         This function writes a string formatted in accordance with the
@@ -94,8 +107,7 @@ __email__ = "henry.winterbottom@noaa.gov"
 
 # ----
 
-from collections import OrderedDict
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 import numpy
 from tools import parser_interface
@@ -107,7 +119,14 @@ from utils.logger_interface import Logger
 # ----
 
 # Define all available functions.
-__all__ = ["read_tcvfile", "scale_tcvrec", "write_tcvfile", "write_tcvstr"]
+__all__ = [
+    "read_tcvfile",
+    "scale_tcvrec",
+    "scale_tcvrecs",
+    "write_tcvfile",
+    "write_tcvrecs",
+    "write_tcvstr",
+]
 
 # ----
 
@@ -115,28 +134,33 @@ logger = Logger(caller_name=__name__)
 
 # ----
 
-TCV_34QUAD_DICT = OrderedDict(
-    {
-        "tcv_center": {"idx": 0, "spval": None},
-        "tcid": {"idx": 1, "spval": None},
-        "event_name": {"idx": 2, "spval": None},
-        "time_ymd": {"idx": 3, "spval": None},
-        "time_hm": {"idx": 4, "spval": None},
-        "lat": {"idx": 5, "spval": None},
-        "lon": {"idx": 6, "spval": None},
-        "stormdir": {"idx": 7, "spval": "-99"},
-        "stormspeed": {"idx": 8, "spval": "-99"},
-        "mslp": {"idx": 9, "spval": None},
-        "poci": {"idx": 10, "spval": "-999"},
-        "roci": {"idx": 11, "spval": "-999"},
-        "vmax": {"idx": 12, "spval": None},
-        "rmw": {"idx": 13, "spval": "-99"},
-        "NE34": {"idx": 14, "spval": "-999"},
-        "SE34": {"idx": 15, "spval": "-999"},
-        "SW34": {"idx": 16, "spval": "-999"},
-        "NW34": {"idx": 17, "spval": "-999"},
-        "stormdepth": {"idx": 18, "spval": "X"},
-    }
+TCV_34QUAD_DICT = {
+    "tcv_center": {"idx": 0, "spval": None},
+    "tcid": {"idx": 1, "spval": None},
+    "event_name": {"idx": 2, "spval": None},
+    "time_ymd": {"idx": 3, "spval": None},
+    "time_hm": {"idx": 4, "spval": None},
+    "lat": {"idx": 5, "spval": None},
+    "lon": {"idx": 6, "spval": None},
+    "stormdir": {"idx": 7, "spval": "-99"},
+    "stormspeed": {"idx": 8, "spval": "-99"},
+    "mslp": {"idx": 9, "spval": None},
+    "poci": {"idx": 10, "spval": "-999"},
+    "roci": {"idx": 11, "spval": "-999"},
+    "vmax": {"idx": 12, "spval": None},
+    "rmw": {"idx": 13, "spval": "-99"},
+    "NE34": {"idx": 14, "spval": "-999"},
+    "SE34": {"idx": 15, "spval": "-999"},
+    "SW34": {"idx": 16, "spval": "-999"},
+    "NW34": {"idx": 17, "spval": "-999"},
+    "stormdepth": {"idx": 18, "spval": "X"},
+}
+
+# Define the TC-vitals record layout; each element contains the
+# attribute name, the record column index, and the missing data value
+# as collected from `TCV_34QUAD_DICT`.
+TCV_34QUAD_LAYOUT = tuple(
+    (item, value["idx"], value["spval"]) for (item, value) in TCV_34QUAD_DICT.items()
 )
 
 # ----
@@ -178,21 +202,13 @@ def __scalegeo__(lat: str, lon: str) -> Tuple[float, float]:
 
     """
 
-    # Initialize the respective TC-vitals attribute variables.
-    (lat_in, lon_in) = (lat, lon)
-
     # Define the scaling values accordingly.
-    (lat_scale, lon_scale) = [1.0 / 10.0 for idx in range(2)]
-
-    if "S" in lat_in:
-        lat_scale = -1.0 / 10.0
-
-    if "E" in lon_in:
-        lon_scale = -1.0 / 10.0
+    lat_scale = -0.1 if "S" in lat else 0.1
+    lon_scale = -0.1 if "E" in lon else 0.1
 
     # Rescale the geographical location values.
-    lat_out = lat_scale * int(lat_in[:-1])
-    lon_out = lon_scale * int(lon_in[:-1])
+    lat_out = lat_scale * int(lat[:-1])
+    lon_out = lon_scale * int(lon[:-1])
 
     return (lat_out, lon_out)
 
@@ -351,57 +367,44 @@ def read_tcvfile(filepath: str) -> object:
 
     # Collect the attributes for the respective TC-vitals record(s);
     # proceed accordingly.
-    tcvobj = parser_interface.object_define()
+    tcvs_dict = {}
 
-    for (idx, tcv) in enumerate(tcvdata.split("\n")):
+    for (idx, tcv) in enumerate(tcvdata.splitlines()):
 
         # Collect the attributes for the current TC-vitals record;
-        # proceed accordingly.
-        if tcv.strip():
-            tcvdict = {}
+        # empty lines are skipped.
+        if tcv and not tcv.isspace():
 
-            # Determine the appropriate Python dictionary to be used
-            # for parsing and assigning values for the TC-vitals
-            # records.
+            # Check that the TC-vitals record is consistent with the
+            # TC-vitals record layout; proceed accordingly.
             msg = f"Parsing TC-vitals record {tcv}."
             logger.info(msg)
             tcvrec = tcv.split()
 
-            if len(tcvrec) == 19:
-                tcvrec_dict = TCV_34QUAD_DICT
-            else:
+            if len(tcvrec) != len(TCV_34QUAD_LAYOUT):
                 msg = (
                     "Too many attributes were found for TC-vitals "
                     f"record {tcvrec}; found {len(tcvrec)}. Aborting!!!"
                 )
                 raise TCVitalsInterfaceError(msg=msg)
 
-            for item in tcvrec_dict:
-
-                # Collect the record index and the missing value
-                # indicator for the respective attribute and update
-                # the local values accordingly.
-                tcvidx = parser_interface.dict_key_value(
-                    dict_in=tcvrec_dict[item], key="idx", no_split=True
-                )
-                attr_value = parser_interface.dict_key_value(
-                    dict_in=tcvrec_dict[item], key="spval", no_split=True
+            # Collect the respective TC-vitals attributes; missing
+            # data are updated with NoneType.
+            tcvdict = {
+                item: (
+                    None
+                    if (spval is not None and tcvrec[tcvidx] == spval)
+                    else tcvrec[tcvidx]
                 )
+                for (item, tcvidx, spval) in TCV_34QUAD_LAYOUT
+            }
 
-                # Collect the respective TC-vitals attribute; proceed
-                # accordingly.
-                tcvdict[item] = tcvrec[tcvidx]
+            # Update the local Python dictionary.
+            tcvs_dict[f"TC{idx}"] = tcvdict
 
-                if attr_value is not None:
-                    if str(attr_value) == str(tcvdict[item]):
-
-                        # Update the missing datum with NoneType.
-                        tcvdict[item] = None
-
-            # Update the local Python object.
-            tcvobj = parser_interface.object_setattr(
-                object_in=tcvobj, key=f"TC{idx}", value=tcvdict
-            )
+    # Define the Python object containing the attributes for each
+    # TC-vitals record.
+    tcvobj = parser_interface.dict_toobject(in_dict=tcvs_dict)
 
     return tcvobj
 
@@ -458,6 +461,70 @@ def scale_tcvrec(tcv_dict: Dict) -> object:
 # ----
 
 
+def scale_tcvrecs(tcv_dict_list: List[Dict]) -> object:
+    """
+    Description
+    -----------
+
+    This function scales the relevant tropical cyclone records for a
+    collection of TC-vitals records to their respective MKS
+    representations and returns a Python object containing arrays of
+    the respective scaled values; the values are identical to those
+    returned by `scale_tcvrec` for each TC-vitals record.
+
+    Parameters
+    ----------
+
+    tcv_dict_list: List[Dict]
+
+        A Python list of Python dictionaries containing the TC-vitals
+        record attributes.
+
+    Returns
+    -------
+
+    tcvs_obj: object
+
+        A Python object containing arrays of the MKS values for the
+        respective TC-vitals record attributes; each array element
+        corresponds to the respective element of `tcv_dict_list`;
+        missing values are NaN.
+
+    """
+
+    # Collect the relevant attributes from the TC-vitals records.
+    tcvs_obj = parser_interface.object_define()
+    (lat, lon) = [
+        numpy.array([tcv_dict[key] for tcv_dict in tcv_dict_list], dtype=str)
+        for key in ["lat", "lon"]
+    ]
+    (mslp, poci, rmw, roci, vmax) = [
+        numpy.array([tcv_dict[key] for tcv_dict in tcv_dict_list], dtype=float)
+        for key in ["mslp", "poci", "rmw", "roci", "vmax"]
+    ]
+
+    # Scale the geographical location values accordingly.
+    tcvs_obj.lat = numpy.where(numpy.char.find(lat, "S") >= 0, -0.1, 0.1) * (
+        numpy.char.rstrip(lat, "NS").astype(float)
+    )
+    tcvs_obj.lon = numpy.where(numpy.char.find(lon, "E") >= 0, -0.1, 0.1) * (
+        numpy.char.rstrip(lon, "EW").astype(float)
+    )
+
+    # Scale the intensity and size values accordingly.
+    (tcvs_obj.mslp, tcvs_obj.vmax) = (mslp * hPa2Pa, vmax)
+    (tcvs_obj.poci, tcvs_obj.rmw, tcvs_obj.roci) = (
+        poci * hPa2Pa,
+        rmw * kn2m,
+        roci * kn2m,
+    )
+
+    return tcvs_obj
+
+
+# ----
+
+
 def write_tcvfile(filepath: str, tcvstr: str) -> None:
     """
     Description
@@ -490,6 +557,43 @@ def write_tcvfile(filepath: str, tcvstr: str) -> None:
 # ----
 
 
+def write_tcvrecs(filepath: str, tcvit_obj_list: List[object]) -> None:
+    """
+    Description
+    -----------
+
+    This function builds and writes the TC-vitals records for a
+    collection of TC-vitals record attribute objects to a specified
+    filepath; the TC-vitals records are written to the filepath at
+    once.
+
+    Parameters
+    ----------
+
+    filepath: str
+
+        A Python string specifying the file path to which to write the
+        TC-vitals record(s).
+
+    tcvit_obj_list: List[object]
+
+        A Python list of Python objects containing the TC-vitals
+        record attributes; see `write_tcvstr` for the respective
+        Python object attributes.
+
+    """
+
+    # Build and write the TC-vitals record(s) to the specified
+    # filepath.
+    tcvstr = "".join(
+        [write_tcvstr(tcvit_obj=tcvit_obj) for tcvit_obj in tcvit_obj_list]
+    )
+    write_tcvfile(filepath=filepath, tcvstr=tcvstr)
+
+
+# ----
+
+
 def write_tcvstr(tcvit_obj: object) -> str:
     """
     Description
@@ -620,7 +724,7 @@ def write_tcvstr(tcvit_obj: object) -> str:
     mand_attr_list = ["lat", "lon", "mslp", "tcid", "time_hm", "time_ymd", "vmax"]
 
     for mand_attr in mand_attr_list:
-        if not parser_interface.object_hasattr(object_in=tcvit_obj, key=mand_attr):
+        if not hasattr(tcvit_obj, mand_attr):
             msg = (
                 "The input TC-vitals variable object does not contain "
                 f"the mandatory attribute {mand_attr}. Aborting!!!"
@@ -628,10 +732,7 @@ def write_tcvstr(tcvit_obj: object) -> str:
             raise TCVitalsInterfaceError(msg=msg)
 
         # Build the TC-vitals record object.
-        value = parser_interface.object_getattr(object_in=tcvit_obj, key=mand_attr)
-        tcvobj = parser_interface.object_setattr(
-            object_in=tcvobj, key=mand_attr, value=value
-        )
+        setattr(tcvobj, mand_attr, getattr(tcvit_obj, mand_attr))
 
     # Check the TC-vitals record attributes; proceed accordingly.
     if (
@@ -669,21 +770,10 @@ def write_tcvstr(tcvit_obj: object) -> str:
     }
 
     # Define the optional TC-vitals record attributes in accordance
-    # with the values provided upon entry.
-    for (opt_attr, _) in opt_attr_dict.items():
-
-        # Collect the TC-vitals record attribute; proceed accordingly.
-        if parser_interface.object_hasattr(object_in=tcvit_obj, key=opt_attr):
-            value = parser_interface.object_getattr(object_in=tcvit_obj, key=opt_attr)
-        else:
-            value = parser_interface.dict_key_value(
-                dict_in=opt_attr_dict, key=opt_attr, no_split=True
-            )
-
-        # Define the TC-vitals record attribute.
-        tcvobj = parser_interface.object_setattr(
-            object_in=tcvobj, key=opt_attr, value=value
-        )
+    # with the values provided upon entry; the default values are
+    # used for attributes not provided upon entry.
+    for (opt_attr, opt_value) in opt_attr_dict.items():
+        setattr(tcvobj, opt_attr, getattr(tcvit_obj, opt_attr, opt_value))
 
     # Check that the TC-vitals records are valid; proceed accordingly.
     if (tcvobj.lat is not None) and (tcvobj.lon is not None):
@@ -691,8 +781,8 @@ def write_tcvstr(tcvit_obj: object) -> str:
         # Scale the hemisphere values accordingly.
         hemip = "N" if (tcvobj.lat > 0) else "S"
         hemim = "E" if (tcvobj.lon < 0) else "W"
-        tcvobj.lat = "%03d%s" % (numpy.abs(numpy.rint(tcvobj.lat * 10)), hemip)
-        tcvobj.lon = "%04d%s" % (numpy.abs(numpy.rint(tcvobj.lon * 10)), hemim)
+        tcvobj.lat = f"{int(round(abs(tcvobj.lat * 10))):03d}{hemip}"
+        tcvobj.lon = f"{int(round(abs(tcvobj.lon * 10))):04d}{hemim}"
 
         # Write the TC-vitals record.
         tcvstr = tcvstr_frmt % (
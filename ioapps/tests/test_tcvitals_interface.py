@@ -74,6 +74,7 @@ import os
 import unittest
 from unittest import TestCase
 
+import numpy
 import pytest
 from ioapps import tcvitals_interface
 from tools import fileio_interface, parser_interface
@@ -133,6 +134,8 @@ class TestTCVitalsMethods(TestCase):
             dirpath, "tests", "test_files", "tcvitals.syndat"
         )
         self.tcv_file = os.path.join(dirpath, "tests", "tcvitals.syndat")
+        self.tcv_spval_file = os.path.join(dirpath, "tests", "tcvitals_spval.syndat")
+        self.tcvrecs_file = os.path.join(dirpath, "tests", "tcvitals_recs.syndat")
 
         # Collect the contents of the example TC-vitals file.
         with open(self.tcv_exfile, "r", encoding="utf-8") as file:
@@ -141,6 +144,77 @@ class TestTCVitalsMethods(TestCase):
         # Define the message to accompany any unit-test failures.
         self.unit_test_msg = "The unit-test for tcvitals_interface function {0} failed."
 
+    @staticmethod
+    def _build_tcvit_obj(tc: str) -> object:
+        """
+        Description
+        -----------
+
+        This method builds the Python object containing the TC-vitals
+        attributes for the respective TC event within the example
+        TC-vitals file.
+
+        Parameters
+        ----------
+
+        tc: str
+
+            A Python string containing the TC-vitals record for the
+            respective TC event.
+
+        Returns
+        -------
+
+        tcvit_obj: object
+
+            A Python object containing the TC-vitals attributes for
+            the respective TC event.
+
+        """
+
+        # Build the local attribute containing the TC-vitals
+        # attributes for the respective TC event.
+        tcvit_obj = parser_interface.object_define()
+        for (tcv_attr, _) in tcv_attrs_dict.items():
+
+            idx = parser_interface.dict_key_value(
+                dict_in=tcv_attrs_dict[tcv_attr], key="idx", no_split=True
+            )
+            dtype = parser_interface.dict_key_value(
+                dict_in=tcv_attrs_dict[tcv_attr], key="dtype", no_split=True
+            )
+
+            value = dtype(tc.split()[idx])
+            tcvit_obj = parser_interface.object_setattr(
+                object_in=tcvit_obj, key=tcv_attr, value=value
+            )
+
+        # Format the geographical location accordingly.
+        scale = 0.1
+        if "S" in tcvit_obj.lat[-1]:
+            scale = -0.1
+        value = float(tcvit_obj.lat[:-1]) * scale
+        tcvit_obj = parser_interface.object_setattr(
+            object_in=tcvit_obj, key="lat", value=value
+        )
+
+        scale = 0.1
+        if "E" in tcvit_obj.lon[-1]:
+            scale = -0.1
+        value = float(tcvit_obj.lon[:-1]) * scale
+        tcvit_obj = parser_interface.object_setattr(
+            object_in=tcvit_obj, key="lon", value=value
+        )
+
+        # Scale the maximum wind speed value from knots to meters
+        # per second.
+        value = tcvit_obj.vmax * mps2kts
+        tcvit_obj = parser_interface.object_setattr(
+            object_in=tcvit_obj, key="vmax", value=value
+        )
+
+        return tcvit_obj
+
     @pytest.mark.order(100)
     def test_cleanup(self: TestCase) -> None:
         """
@@ -157,11 +231,67 @@ class TestTCVitalsMethods(TestCase):
         """
 
         # Define the list of (the) test file(s) to be removed.
-        filelist = [self.tcv_file]
+        filelist = [self.tcv_file, self.tcv_spval_file, self.tcvrecs_file]
 
         # Remove the specified files.
         fileio_interface.removefiles(filelist=filelist)
 
+    @pytest.mark.order(1)
+    def test_scale_tcvrecs(self: TestCase) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the tcvitals_interface
+        `scale_tcvrecs` function.
+
+        """
+
+        # Write a TC-vitals file containing the TC events in the
+        # example TC-vitals file and a TC event with missing data
+        # values; the TC-vitals storm depth attribute is appended to
+        # each TC-vitals record.
+        tcv_list = [f"{tc} D" for tc in self.tcinfo.splitlines() if tc.strip()]
+        tcv_list.append(
+            "NHC  12L JOSE      20170901 0000 150N 0400W -99 -99 1000 -999 "
+            "-999 25 -99 -999 -999 -999 -999 X"
+        )
+        with open(self.tcv_spval_file, "w", encoding="utf-8") as file:
+            file.write("\n".join(tcv_list) + "\n")
+
+        # Collect the TC-vitals record attributes; missing data values
+        # are defined as NoneType.
+        tcv_dict_list = list(
+            vars(tcvitals_interface.read_tcvfile(filepath=self.tcv_spval_file)).values()
+        )
+
+        # Compare the scaled TC-vitals record attributes to those
+        # scaled for each TC-vitals record; missing data values are
+        # NaN rather than NoneType.
+        tcvs_obj = tcvitals_interface.scale_tcvrecs(tcv_dict_list=tcv_dict_list)
+        for (idx, tcv_dict) in enumerate(tcv_dict_list):
+            tcv_obj = tcvitals_interface.scale_tcvrec(tcv_dict=tcv_dict)
+            for (attr, value) in vars(tcv_obj).items():
+                if value is None:
+                    self.assertTrue(
+                        numpy.isnan(getattr(tcvs_obj, attr)[idx]),
+                        msg=(self.unit_test_msg.format("scale_tcvrecs")),
+                    )
+                    continue
+
+                self.assertEqual(
+                    value,
+                    getattr(tcvs_obj, attr)[idx],
+                    msg=(self.unit_test_msg.format("scale_tcvrecs")),
+                )
+
+        # Check that the missing data values are NaN.
+        for attr in ["poci", "rmw", "roci"]:
+            self.assertTrue(
+                numpy.isnan(getattr(tcvs_obj, attr)[-1]),
+                msg=(self.unit_test_msg.format("scale_tcvrecs")),
+            )
+
     @pytest.mark.order(1)
     def test_write_tcvfile(self: TestCase) -> None:
         """
@@ -184,6 +314,49 @@ class TestTCVitalsMethods(TestCase):
         self.assertTrue(check, msg=(
             self.unit_test_msg.format("write_tcvfile")))
 
+    @pytest.mark.order(1)
+    def test_write_tcvrecs(self: TestCase) -> None:
+        """
+        Description
+        -----------
+
+        This method provides a unit-test for the tcvitals_interface
+        `write_tcvrecs` function.
+
+        """
+
+        # Build the local attributes containing the TC-vitals
+        # attributes for each TC event in the example TC-vitals file;
+        # a TC event with a missing required attribute is included
+        # and no TC-vitals record is to be written for it.
+        tcvit_obj_list = [
+            self._build_tcvit_obj(tc=tc) for tc in self.tcinfo.strip().split("\n")
+        ]
+        tcvit_obj = self._build_tcvit_obj(tc=self.tcinfo.strip().split("\n")[0])
+        tcvit_obj.lat = None
+        tcvit_obj_list.insert(1, tcvit_obj)
+
+        # Write the TC-vitals records and compare the generated
+        # TC-vitals file to the TC-vitals records for each TC event.
+        tcvitals_interface.write_tcvrecs(
+            filepath=self.tcvrecs_file, tcvit_obj_list=tcvit_obj_list
+        )
+        tcvstr = "".join(
+            tcvitals_interface.write_tcvstr(tcvit_obj=tcvit_obj)
+            for tcvit_obj in tcvit_obj_list
+        )
+        with open(self.tcvrecs_file, "r", encoding="utf-8") as file:
+            tcvrecs = file.read()
+
+        self.assertEqual(
+            tcvrecs, tcvstr, msg=(self.unit_test_msg.format("write_tcvrecs"))
+        )
+        self.assertEqual(
+            len(tcvrecs.splitlines()),
+            len(tcvit_obj_list) - 1,
+            msg=(self.unit_test_msg.format("write_tcvrecs")),
+        )
+
     @pytest.mark.order(1)
     def test_write_tcvstr(self: TestCase) -> None:
         """
@@ -201,44 +374,7 @@ class TestTCVitalsMethods(TestCase):
 
             # Build the local attribute containing the TC-vitals
             # attributes for the respective TC event.
-            tcvit_obj = parser_interface.object_define()
-            for (tcv_attr, _) in tcv_attrs_dict.items():
-
-                idx = parser_interface.dict_key_value(
-                    dict_in=tcv_attrs_dict[tcv_attr], key="idx", no_split=True
-                )
-                dtype = parser_interface.dict_key_value(
-                    dict_in=tcv_attrs_dict[tcv_attr], key="dtype", no_split=True
-                )
-
-                value = dtype(tc.split()[idx])
-                tcvit_obj = parser_interface.object_setattr(
-                    object_in=tcvit_obj, key=tcv_attr, value=value
-                )
-
-            # Format the geographical location accordingly.
-            scale = 0.1
-            if "S" in tcvit_obj.lat[-1]:
-                scale = -0.1
-            value = float(tcvit_obj.lat[:-1]) * scale
-            tcvit_obj = parser_interface.object_setattr(
-                object_in=tcvit_obj, key="lat", value=value
-            )
-
-            scale = 0.1
-            if "E" in tcvit_obj.lon[-1]:
-                scale = -0.1
-            value = float(tcvit_obj.lon[:-1]) * scale
-            tcvit_obj = parser_interface.object_setattr(
-                object_in=tcvit_obj, key="lon", value=value
-            )
-
-            # Scale the maximum wind speed value from knots to meters
-            # per second.
-            value = tcvit_obj.vmax * mps2kts
-            tcvit_obj = parser_interface.object_setattr(
-                object_in=tcvit_obj, key="vmax", value=value
-            )
+            tcvit_obj = self._build_tcvit_obj(tc=tc)
 
             # Write the formatted TC-vitals attributes for the
             # respective TC event.
@@ -32,6 +32,11 @@ Description
 Functions
 ---------
 
+    _get_engine(ncfile, ncfile_mtime)
+
+        This function determines the xarray engine to be used to open
+        a netCDF formatted file from the file format signature.
+
     dataset(ncfile, varobj_list, unlimitdim = None)
 
         This function defines a xarray dataset object and writes the
@@ -63,6 +68,8 @@ Requirements
 
 - ufs_pytils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
 
+- netCDF4; https://github.com/Unidata/netcdf4-python
+
 - xarray; https://github.com/pydata/xarray
 
 Author(s)
@@ -91,8 +98,12 @@ __email__ = "henry.winterbottom@noaa.gov"
 
 # ----
 
+import functools
+import io
+import os
 from typing import Dict, List
 
+import netCDF4
 import numpy
 import xarray
 from tools import parser_interface
@@ -107,6 +118,54 @@ logger = Logger(caller_name=__name__)
 # ----
 
 
+@functools.lru_cache(maxsize=256)
+def _get_engine(ncfile: str, ncfile_mtime: int) -> str:
+    """
+    Description
+    -----------
+
+    This function determines the xarray engine to be used to open a
+    netCDF formatted file from the file format signature; netCDF
+    classic and 64-bit offset formatted files are opened using the
+    scipy engine while all other formats (e.g., netCDF-4/HDF5) are
+    opened using the netCDF4 engine.
+
+    Parameters
+    ----------
+
+    ncfile: str
+
+        A Python string specifying the path to the netCDF formatted
+        file.
+
+    ncfile_mtime: int
+
+        A Python integer specifying the netCDF formatted file path
+        modification time (in nanoseconds); this is used only as a
+        cache key.
+
+    Returns
+    -------
+
+    engine: str
+
+        A Python string specifying the xarray engine.
+
+    """
+
+    # Read the file format signature and define the xarray engine
+    # accordingly.
+    with io.open(ncfile, "rb") as file:
+        signature = file.read(4)
+
+    engine = "scipy" if signature in [b"CDF\x01", b"CDF\x02"] else "netcdf4"
+
+    return engine
+
+
+# ----
+
+
 def dataset(ncfile: str, varobj_list: List, unlimitdim: str = None) -> None:
     """
     Description
@@ -189,15 +248,23 @@ def open(ncfile: str) -> Dataset:
 
     """
 
+    # Determine the xarray engine from the netCDF-formatted file
+    # format; proceed accordingly.
+    try:
+        engine = _get_engine(ncfile=ncfile, ncfile_mtime=os.stat(ncfile).st_mtime_ns)
+    except OSError:
+        engine = "scipy"
+    fallback_engine = "netcdf4" if engine == "scipy" else "scipy"
+
     # Open the Python object containing the netCDF-formatted file
     # contents; proceed accordingly.
     try:
-        ncfile_obj = xarray.open_dataset(ncfile, engine="scipy")
+        ncfile_obj = xarray.open_dataset(ncfile, engine=engine)
     except Exception:
-        msg = "Unable to use xarray engine scipy; trying netCDF4."
+        msg = f"Unable to use xarray engine {engine}; trying {fallback_engine}."
         logger.warn(msg=msg)
         try:
-            ncfile_obj = xarray.open_dataset(ncfile, engine="netcdf4")
+            ncfile_obj = xarray.open_dataset(ncfile, engine=fallback_engine)
         except Exception as errmsg:
             msg = (
                 f"Opening the netCDF-formatted file path {ncfile} failed "
@@ -301,9 +368,9 @@ def varobj(varval: numpy.array, coords: Dict, dims: List, ncvarname: str) -> Dat
     """
 
     # Define the xarray object.
-    xarray_obj = xarray.DataArray(varval, coords=coords, dims=dims)
-    var_obj = xarray_obj.to_dataset(name=ncvarname)
-    xarray_obj.close()
+    var_obj = xarray.DataArray(
+        varval, coords=coords, dims=dims, name=ncvarname
+    ).to_dataset()
 
     return var_obj
 
@@ -336,10 +403,20 @@ def write(ncfile: str, var_obj: DataArray, var_arr: numpy.array) -> None:
         A Python numpy.array type variable containing the value array
         to be written to the existing variable within the netCDF file.
 
+    Raises
+    ------
+
+    XArrayInterfaceError:
+
+        - raised if the netCDF variable name cannot be determined from
+          the input variable attributes.
+
+        - raised if an exception is encountered while writing the
+          variable to the netCDF-formatted file path.
+
     """
 
     # Collect the attributes for the respective netCDF variable.
-    dataset = open(ncfile=ncfile)
     ncvarname = parser_interface.object_getattr(
         object_in=var_obj, key="ncvarname", force=True
     )
@@ -353,7 +430,14 @@ def write(ncfile: str, var_obj: DataArray, var_arr: numpy.array) -> None:
     msg = f"Writing variable {ncvarname} to {ncfile}."
     logger.info(msg=msg)
 
-    # Write the variable values to the netCDF-formatted file path.
-    dataset[ncvarname][:] = var_arr[:]
-    dataset.to_netcdf(ncfile, engine="scipy")
-    dataset.close()
+    # Write the variable values to the netCDF-formatted file path;
+    # only the respective variable is updated within the file.
+    try:
+        with netCDF4.Dataset(filename=ncfile, mode="a") as ncdata:
+            ncdata.variables[ncvarname][:] = var_arr[:]
+    except Exception as errmsg:
+        msg = (
+            f"Writing variable {ncvarname} to netCDF-formatted file path "
+            f"{ncfile} failed with error {errmsg}. Aborting!!!"
+        )
+        raise XArrayInterfaceError(msg=msg) from errmsg
@@ -266,6 +266,16 @@ __all__ = [
 
 # ----
 
+# Define the values corresponding to the (case-insensitive) string
+# values cast by `dict_formatter`.
+STR_VALUE_DICT = {"none": None, "true": True, "false": False}
+
+# Define the FORTRAN 90 boolean format values corresponding to the
+# Python boolean values cast by `f90_bool`.
+F90_BOOL_DICT = {True: "T", False: "F"}
+
+# ----
+
 
 def dict_formatter(in_dict: Dict) -> Dict:
     """
@@ -304,38 +314,18 @@ def dict_formatter(in_dict: Dict) -> Dict:
                 new_dct[key] = sorted_by_keys(value)
             else:
 
-                # Check if the key and value pair is a boolean type
-                # argument and proceed accordingly.
-                test_value = value
-                if isinstance(test_value, bool):
-                    if test_value:
-                        value = True
-
-                    if not test_value:
-                        value = False
-
                 # Check if the key and value pair is a string type
-                # argument and proceed accordingly.
-                if isinstance(test_value, str):
+                # argument and proceed accordingly; boolean and all
+                # other type arguments are not modified.
+                if isinstance(value, str):
+                    test_value = value
                     try:
-                        dummy = float(test_value)
-                        if "." in test_value:
-                            value = float(test_value)
-                        else:
+                        value = float(test_value)
+                        if "." not in test_value:
                             value = int(test_value)
 
                     except ValueError:
-                        if test_value.lower() == "none":
-                            value = None
-
-                        elif test_value.lower() == "true":
-                            value = True
-
-                        elif test_value.lower() == "false":
-                            value = False
-
-                        else:
-                            value = str(test_value)
+                        value = STR_VALUE_DICT.get(test_value.lower(), test_value)
 
                 # Update the output dictionary key and value pair.
                 new_dct[key] = value
@@ -810,12 +800,10 @@ def f90_bool(value: Any) -> Any:
     """
 
     # Check the type for the respective input value; proceed
-    # accordingly.
+    # accordingly; the type is checked since integer values compare
+    # equal to the respective boolean values.
     if isinstance(value, bool):
-        if value:
-            value = "T"
-        if not value:
-            value = "F"
+        value = F90_BOOL_DICT[value]
 
     return value
 